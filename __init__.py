@@ -42,30 +42,46 @@ bl_info = {
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
-# Reloads modules if they exist in local symbols table.
-if "bpy" in locals():
-
+import sys
+
+# Reloads submodules on Blender's "Reload Scripts". Keying off sys.modules
+# (rather than a `"..." in locals()` check, which never fired because the
+# names live in module globals) guarantees edited submodule source is
+# actually picked up without restarting Blender. Submodules not yet loaded
+# stay lazy (see __getattr__ below).
+_MESH_OPTIMISATION_MODULE = __name__ + ".source.mesh_optimisation"
+if _MESH_OPTIMISATION_MODULE in sys.modules:
     import importlib
-
-    if "MeshOptimisationModule" in locals():
-        from .source import mesh_optimisation
-        importlib.reload(mesh_optimisation)
-
-# Imports module classes if "bpy" module does not exist (infers first run).
-else:
-    from .source.mesh_optimisation import MeshOptimisationModule
+    importlib.invalidate_caches()
+    importlib.reload(sys.modules[_MESH_OPTIMISATION_MODULE])
 
 import bpy
 
-# List of all addon modules.
-modules = [MeshOptimisationModule]
+
+# Lazily resolves addon module classes on first attribute access (PEP 562).
+#
+# Keeps importing this root module (e.g. Blender scanning `bl_info` for the
+# addon preference panel) from transitively pulling in `bmesh` and all of
+# `mesh_optimisation` until the addon is actually enabled.
+def __getattr__(name):
+    if name == "MeshOptimisationModule":
+        from .source.mesh_optimisation import MeshOptimisationModule
+        globals()[name] = MeshOptimisationModule
+        return MeshOptimisationModule
+    raise AttributeError(name)
+
+
+# Returns list of all addon modules (resolved lazily on addon enable).
+def _addon_modules():
+    from .source.mesh_optimisation import MeshOptimisationModule
+    return [MeshOptimisationModule]
 
 # Called by Blender and triggers addon's module registerations.
 def register():
-    for mod in modules:
+    for mod in _addon_modules():
         mod.register()
 
 # Called by Blender and triggers addon's module unregisterations.
 def unregister():
-    for mod in reversed(modules):
+    for mod in reversed(_addon_modules()):
         mod.unregister()
\ No newline at end of file
@@ -10,14 +10,46 @@
 
 """
 
+from __future__ import annotations
+
 import bpy
-import bmesh
 import mathutils
 import numpy as np
 
-from dataclasses import dataclass
+import logging
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Imported lazily inside operator `execute` methods so that importing
+    # this module (IDEs, linters, addon scanners) never dynamically loads
+    # bmesh; the guard keeps the name visible to type checkers only.
+    import bmesh
+
+
+# Module logger: diagnostics are emitted at DEBUG so heavy-mesh operator
+# runs are not slowed down by synchronous writes to Blender's console
+# widget unless debugging is explicitly enabled.
+_log = logging.getLogger(__name__)
+
+
+# Numba is an optional dependency: when available, the pure-numeric lattice
+# kernels below are JIT-compiled to native code; without it they run as
+# plain Python so the addon still installs in a stock Blender.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
 
 
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
@@ -27,11 +59,9 @@ from typing import Dict
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
-@dataclass
-class Tuple2DCoord:
-    def __init__(self, x, y=None):
-        self.x = x
-        self.y = y
+# Two-field coordinate carrier; C-backed and cheap to construct. Only used
+# for the window shape returned by `_derive_window_shape`, never per face.
+Tuple2DCoord = namedtuple('Tuple2DCoord', ['x', 'y'])
 
 
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
@@ -106,6 +136,15 @@ class AddonProperties(bpy.types.PropertyGroup):
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
 
+# Maps filter strategy ID to whether unselected faces are the ones deleted,
+# so strategy is resolved with one dict lookup instead of repeated string
+# comparisons in the operator hot path.
+_FILTER_STRATEGY_DELETES_UNSELECTED = {
+    'filter_strategy.unselected_faces': True,
+    'filter_strategy.selected_faces': False,
+}
+
+
 class FaceFilterOperator(bpy.types.Operator):
     """Operator for filtering/removing faces from mesh using a specific strategy"""
 
@@ -114,63 +153,249 @@ class FaceFilterOperator(bpy.types.Operator):
 
 
     def execute(self, context):
-        print('=========================================================')
-        print('Executing Face Filter Operation.')
-        print('=========================================================')
-        scene = context.scene
+        # Deferred so module import stays cheap; hits sys.modules cache on
+        # every call after the first.
+        import bmesh
+
+        _log.debug('Executing Face Filter Operation.')
+
+        # Resolve the addon property group once (see FaceScalingOperator).
         filter_strategy = context.scene.addon_props.filter_strats
-        removed_face_cnt = 0
-        
-        print('Selected Filter Strategy: %s' % filter_strategy)
 
-        # Set mode to edit or else bmesh.from_edit_mesh() will fail.
-        bpy.ops.object.mode_set(mode='EDIT')
+        _log.debug('Selected Filter Strategy: %s', filter_strategy)
 
-        # Loop through all selected active objects in edit mode.
-        selected_objs = context.selected_objects
-        for obj in selected_objs:
-            # Convert mesh to bmesh object.
-            obj_data = obj.data
-            obj_bmesh = bmesh.from_edit_mesh(obj_data)
-
-            # Get faces to filter based on filter strategy
-            faces_to_filter = []
-            if filter_strategy == 'filter_strategy.unselected_faces':
-                faces_to_filter = [face for face in obj_bmesh.faces if not face.select]
-            if filter_strategy == 'filter_strategy.selected_faces':
-                faces_to_filter = [face for face in obj_bmesh.faces if face.select]
-
-            # Delete all faces within faces filter.
-            bmesh.ops.delete(obj_bmesh, geom=faces_to_filter, context='FACES')
-            removed_face_cnt += len(faces_to_filter)
-            bmesh.update_edit_mesh(obj_data)
-
-            # Do some cleanup of the bmesh manually.
-            obj_bmesh.select_flush_mode()
-            obj_bmesh.free()
-
-        print('Removed a total of %s faces from a collection of %s objects.'
-              % (removed_face_cnt, len(selected_objs)))
-
-        # Set selected objects as active.
-        for obj in selected_objs:
-            bpy.context.view_layer.objects.active = obj
+        # Resolve the bpy.ops wrappers once: every `bpy.ops.x.y` access walks
+        # two dynamic namespaces and allocates a fresh BPyOpsSubModOp wrapper.
+        mode_set = bpy.ops.object.mode_set
+        join = bpy.ops.object.join
 
-        # Join the active selected objs to form one mesh after face filter.
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.ops.object.join()
+        # Bail before touching any bpy.ops when nothing is selected; each of
+        # the operator calls below would otherwise trigger a depsgraph
+        # evaluation for a no-op click.
+        selected_objs = context.selected_objects
+        if not selected_objs:
+            _log.debug('No objects selected, nothing to filter.')
+            return {'CANCELLED'}
+
+        # Set last selected object as active (each write to `active` walks
+        # Blender's depsgraph tagging machinery, so write it exactly once).
+        # The view layer object collection is resolved once rather than
+        # re-walking the bpy.context RNA chain on each access.
+        vl_objs = bpy.context.view_layer.objects
+        vl_objs.active = selected_objs[-1]
+
+        # Join all selected objs into one mesh up front while the selection
+        # and active state is still valid. This collapses the N per-object
+        # topology updates that bmesh.ops.delete would otherwise trigger
+        # into a single delete on the joined mesh. A single selected object
+        # has nothing to join with, so skip the operator call entirely.
+        mode_set(mode='OBJECT')
+        if len(selected_objs) > 1:
+            join()
+        joined_obj = vl_objs.active
+
+        # Read the joined mesh's face selection state while still in object
+        # mode: `polygons.foreach_get` fills a contiguous numpy buffer from
+        # the underlying C array in one call, instead of a Python attribute
+        # lookup per face (dominant cost on 100k+ face meshes).
+        sel_mask = np.empty(len(joined_obj.data.polygons), dtype=np.bool_)
+        joined_obj.data.polygons.foreach_get('select', sel_mask)
+
+        # Derive the delete mask based on filter strategy. The removed-face
+        # count comes straight from the mask sum; each branch below then
+        # materializes only the index array it actually needs.
+        deletes_unselected = _FILTER_STRATEGY_DELETES_UNSELECTED[filter_strategy]
+        delete_mask = ~sel_mask if deletes_unselected else sel_mask
+
+        obj_data = joined_obj.data
+        removed_face_cnt = int(delete_mask.sum())
+
+        # All destructive face filtering happens on an object-mode bmesh
+        # (bmesh.new + from_mesh/to_mesh) so the operator never round-trips
+        # through edit mode for the delete; every mode toggle costs a full
+        # depsgraph evaluation and edit-mesh rebuild on large meshes.
+        # bmesh.ops.delete is used regardless of how many faces are going:
+        # it keeps UV layers, smooth flags, creases and every other custom
+        # data layer intact, which a rebuild-from-kept-faces shortcut would
+        # silently drop.
+        #
+        # Delete all filtered faces in one bmesh pass over the joined mesh.
+        filter_indices = np.flatnonzero(delete_mask)
+        work_bmesh = bmesh.new()
+        work_bmesh.from_mesh(obj_data)
+        work_bmesh.faces.ensure_lookup_table()
+
+        # itemgetter performs the bulk face lookup in C; it returns a
+        # bare element (not a tuple) for a single index, hence the guard.
+        if len(filter_indices) > 1:
+            faces_to_filter = itemgetter(*filter_indices)(work_bmesh.faces)
+        else:
+            faces_to_filter = [work_bmesh.faces[i] for i in filter_indices]
+        bmesh.ops.delete(work_bmesh, geom=faces_to_filter, context='FACES')
+
+        # Merge vertex by distance of 0.0001m to get rid of duped verts
+        # and geom artefacts, on the already-open bmesh: bmesh.ops skips
+        # the operator subsystem (undo push, depsgraph evaluation,
+        # redraw) that bpy.ops.mesh.remove_doubles pays.
+        bmesh.ops.remove_doubles(work_bmesh, verts=work_bmesh.verts, dist=0.0001)
+        work_bmesh.to_mesh(obj_data)
+        work_bmesh.free()
+
+        _log.debug('Removed a total of %s faces from a collection of %s objects.',
+                   removed_face_cnt, len(selected_objs))
 
         # Recalculate and set origin to center of mass for joined object.
-        bpy.ops.object.origin_set(type='ORIGIN_CENTER_OF_MASS')
+        # Done directly (area-weighted mean of face centers, shift verts,
+        # move the object by the same offset in world space) instead of via
+        # bpy.ops.object.origin_set, which pays a full operator invocation
+        # (undo push, depsgraph re-evaluation) for the same arithmetic.
+        self._set_origin_to_center_of_mass(joined_obj)
 
-        # Merge vertex by distance of 0.0001m to get rid of duped verts and geom artefacts.
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.remove_doubles(threshold=0.0001)
-
-        print('Completed Face Filter Operation.')
+        _log.debug('Completed Face Filter Operation.')
         return {'FINISHED'}
-    
-    
+
+
+    def _set_origin_to_center_of_mass(self, obj) -> None:
+        """Moves object origin to its surface center of mass in-place.
+
+        Equivalent to `bpy.ops.object.origin_set(type='ORIGIN_CENTER_OF_MASS')`
+        but computed with bulk foreach_get/foreach_set passes, skipping the
+        operator subsystem entirely.
+
+        Arguments:
+            obj: Mesh object (in object mode) whose origin to recalculate.
+        """
+        obj_data = obj.data
+        poly_cnt = len(obj_data.polygons)
+        if poly_cnt == 0:
+            return
+
+        # Surface center of mass: area-weighted mean of the face centers.
+        face_centers = np.empty(poly_cnt * 3, dtype=np.float32)
+        face_areas = np.empty(poly_cnt, dtype=np.float32)
+        obj_data.polygons.foreach_get('center', face_centers)
+        obj_data.polygons.foreach_get('area', face_areas)
+        total_area = face_areas.sum()
+        if total_area == 0:
+            return
+        centroid = (face_centers.reshape(poly_cnt, 3)
+                    * face_areas[:, None]).sum(axis=0) / total_area
+
+        # Shift every vert so the centroid becomes the local origin, then
+        # move the object by the same offset in world space so nothing
+        # visibly moves in the viewport.
+        vert_cnt = len(obj_data.vertices)
+        vert_cos = np.empty(vert_cnt * 3, dtype=np.float32)
+        obj_data.vertices.foreach_get('co', vert_cos)
+        vert_cos = vert_cos.reshape(vert_cnt, 3)
+        vert_cos -= centroid
+        obj_data.vertices.foreach_set('co', vert_cos.ravel())
+        obj_data.update()
+
+        world_origin = obj.matrix_world @ mathutils.Vector(centroid)
+        obj.matrix_world.translation = world_origin
+
+
+# Hoisted so panel draw() (called on every viewport redraw) skips the
+# LOAD_GLOBAL + LOAD_ATTR chain of `FaceFilterOperator.bl_idname`.
+_FACE_FILTER_OP_ID = FaceFilterOperator.bl_idname
+
+
+# In-plane axis pairs indexed by normal axis (0=X, 1=Y, 2=Z), i.e. the two
+# mesh axes spanning a plane whose normal points along the indexing axis.
+_PLANE_AXES = np.array([[1, 2], [0, 2], [0, 1]])
+
+
+@njit(cache=True, boundscheck=False, nogil=True)
+def _greedy_merge_rects(occupancy: np.ndarray, materials: np.ndarray) -> np.ndarray:
+    """Plans maximal merge rectangles over a plane lattice (greedy meshing).
+
+    For each unvisited face cell the run is first extended along the row,
+    then extended row-by-row downward while every cell is occupied,
+    unvisited and carries the same material index. Emitting maximal
+    rectangles instead of fixed-size blocks yields far fewer merged quads
+    and proportionally fewer bmesh ops downstream.
+
+    Tight nested small-int loop kept free of any Blender API calls so Numba
+    (when installed) compiles it to native code instead of falling back to
+    object mode.
+
+    Arguments:
+        occupancy: 2D uint8 lattice, 1 where a face exists and 0 elsewhere.
+        materials: 2D int64 lattice of face material indices (same shape).
+
+    Returns:
+        `(M, 4)` int64 array of (row, col, height, width) merge rectangles.
+    """
+    height, width = occupancy.shape
+    visited = np.zeros(occupancy.shape, dtype=np.uint8)
+    rects = []
+    for row in range(height):
+        for col in range(width):
+            if occupancy[row, col] == 0 or visited[row, col] == 1:
+                continue
+            material = materials[row, col]
+
+            # Extend the run along the row while cells match.
+            rect_w = 1
+            while (col + rect_w < width and occupancy[row, col + rect_w] == 1
+                   and visited[row, col + rect_w] == 0
+                   and materials[row, col + rect_w] == material):
+                rect_w += 1
+
+            # Extend downward while the whole candidate row matches.
+            rect_h = 1
+            while row + rect_h < height:
+                row_matches = True
+                for c in range(col, col + rect_w):
+                    if (occupancy[row + rect_h, c] == 0
+                            or visited[row + rect_h, c] == 1
+                            or materials[row + rect_h, c] != material):
+                        row_matches = False
+                        break
+                if not row_matches:
+                    break
+                rect_h += 1
+
+            for r in range(row, row + rect_h):
+                for c in range(col, col + rect_w):
+                    visited[r, c] = 1
+            rects.append((row, col, rect_h, rect_w))
+
+    rect_arr = np.empty((len(rects), 4), dtype=np.int64)
+    for i in range(len(rects)):
+        rect_arr[i, 0] = rects[i][0]
+        rect_arr[i, 1] = rects[i][1]
+        rect_arr[i, 2] = rects[i][2]
+        rect_arr[i, 3] = rects[i][3]
+    return rect_arr
+
+
+@lru_cache(maxsize=32)
+def _derive_window_shape(scale_factor: int, scale_window_shape: str) -> Tuple2DCoord:
+    """Derive sliding window shape based on given scale factor and desired shape.
+
+    Pure function of two small-domain arguments (three shape strings, small
+    integer factors), so results are memoized with lru_cache: repeat
+    operator invocations skip the string compares and tuple allocation.
+
+    Arguments:
+        scale_factor: Integer used to scale window shape by.
+        scale_window_shape: Shape of the window e..g square, vertical rectangle etc.
+
+    Returns:
+        Tuple2DCoord containing window shape, else `None` if derivation fails
+        (callers report the unsupported shape to the user).
+    """
+    if scale_window_shape == 'scale_window_shapes.square':
+        return Tuple2DCoord(scale_factor, scale_factor)
+    if scale_window_shape == 'scale_window_shapes.h_rect':
+        return Tuple2DCoord(0, scale_factor)
+    if scale_window_shape == 'scale_window_shapes.v_rect':
+        return Tuple2DCoord(scale_factor, 0)
+    return None
+
+
 class FaceScalingOperator(bpy.types.Operator):
     """Operator for scaling/merging mutiple faces from mesh into one to reduce geometry complexity"""
 
@@ -179,76 +404,253 @@ class FaceScalingOperator(bpy.types.Operator):
 
 
     def execute(self, context):
-        print('=========================================================')
-        print('     Executing Face Scaling Operation.')
-        print('=========================================================')
-        scene = context.scene
-        scale_factor = context.scene.addon_props.face_scale_factor
-        scale_selected_faces_only = context.scene.addon_props.scale_selected_faces
-        scale_window_shape = context.scene.addon_props.scale_window_shape
-
-        # Set mode to edit or else bmesh.from_edit_mesh() will fail.
-        bpy.ops.object.mode_set(mode='EDIT')
+        # Deferred so module import stays cheap (see FaceFilterOperator).
+        import bmesh
+
+        _log.debug('Executing Face Scaling Operation.')
+
+        # Resolve the addon property group once; each `context.scene.X`
+        # access walks Blender's RNA descriptor chain.
+        props = context.scene.addon_props
+        scale_factor = props.face_scale_factor
+        scale_selected_faces_only = props.scale_selected_faces
+        scale_window_shape = props.scale_window_shape
+
+        # Merging faces cannot currently keep the UV layout intact, so with
+        # preserve UV set there is nothing to plan or apply. Surface that
+        # to the user before any gather work — a silent no-op behind a
+        # checkbox just looks like a broken Scale button.
+        if props.preserve_uv:
+            self.report(
+                {'WARNING'}, 'Preserve UV is not yet supported by face scaling.')
+            return {'FINISHED'}
 
-        # Loop through each selected object and apply optimisation.
         selected_objs = context.selected_objects
-        for obj in selected_objs:
-            obj_data = obj.data
-            obj_bmesh = bmesh.from_edit_mesh(obj_data)
 
-            # Selected subset of faces if we only want to scale selected mesh faces.
-            bmesh_faces = []
+        # Bail before touching any bpy.ops when nothing is selected (see
+        # FaceFilterOperator): with no active object the trailing edit-mode
+        # switch would fail its poll and raise, and there is nothing to
+        # scale anyway.
+        if not selected_objs:
+            _log.debug('No objects selected, nothing to scale.')
+            return {'CANCELLED'}
+
+        # Force object mode before the gathers: the operator can be invoked
+        # from edit mode (that is where users select faces), and in edit
+        # mode `Mesh.polygons` is the stale snapshot taken at edit-mode
+        # entry — wrong selection mask and, after topology edits, face
+        # indices that no longer match the live mesh. Leaving edit mode
+        # flushes the edit bmesh back into the Mesh datablock first.
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        # Bulk-read per-face attributes for every object in object mode,
+        # serially on the main thread: foreach_get holds the GIL for its C
+        # copy and calling RNA off the main thread is unsupported by
+        # Blender, so a thread pool here would only serialize on the GIL
+        # and add executor overhead.
+        face_attrs = {
+            obj.name: self._gather_face_attrs(obj) for obj in selected_objs}
+
+        # Subset to the selected faces (when requested) and validate quad
+        # topology for every object up front, all from the object-mode
+        # arrays: edit mode (with its edit-mesh bookkeeping and depsgraph
+        # evaluation) is only ever entered once validation has passed.
+        face_subsets = {}
+        for obj in selected_objs:
+            normals, centers, sel_mask, loop_totals, materials = face_attrs[obj.name]
             if scale_selected_faces_only:
-                bmesh_faces = [face for face in obj_bmesh.faces if face.select]
+                face_indices = np.flatnonzero(sel_mask)
             else:
-                bmesh_faces = obj_bmesh.faces
+                face_indices = np.arange(len(sel_mask))
 
             # Ensure mesh has full-quad topology (no traingles).
-            if not self._has_full_quad_topology(bmesh_faces):
+            if not self._has_full_quad_topology(loop_totals[face_indices]):
                 self.report(
                     {'ERROR'}, 'Optimisation can only be applied to mesh with full-quad topology.')
                 return {'FINISHED'}
-        
-            # Applies optimisation and handles error/failure reporting back to user.
-            self._apply_face_scaling(bmesh_faces, scale_factor, scale_window_shape)
+            face_subsets[obj.name] = (
+                face_indices, normals[face_indices], centers[face_indices],
+                materials[face_indices])
+
+        # Derive sliding window shape, used as the minimum merge-region size.
+        window_shape = _derive_window_shape(scale_factor, scale_window_shape)
+        if window_shape is None:
+            self.report(
+                {'ERROR'},
+                'Unsupported window shape %s cannot be used (report this to dev).'
+                % scale_window_shape)
+            return {'FINISHED'}
+        _log.debug('WINDOW SHAPE: (x:%s, y:%s)', window_shape.x, window_shape.y)
+        min_h = max(int(window_shape.y), 1)
+        min_w = max(int(window_shape.x), 1)
+
+        # Plan all merges while still in object mode. Planning is pure
+        # numpy/numba over the gathered arrays with no Blender API calls,
+        # so multi-object selections fan the planning out across a thread
+        # pool (numpy's C loops release the GIL, and the greedy kernel is
+        # compiled with nogil=True); the bmesh mutation below stays serial
+        # on the main thread as bmesh is not thread-safe. The workers map
+        # over subset tuples resolved here on the main thread — even an
+        # `obj.name` read is an RNA access, which is unsupported off the
+        # main thread.
+        subsets = [face_subsets[obj.name] for obj in selected_objs]
+
+        def plan_for(subset):
+            _, normals, centers, materials = subset
+            return self._compute_merge_plan(normals, centers, materials, min_h, min_w)
+
+        if len(subsets) > 1:
+            with ThreadPoolExecutor() as executor:
+                plans = list(executor.map(plan_for, subsets))
+        else:
+            plans = [plan_for(subset) for subset in subsets]
 
-        print('Completed Face Scaling Operation.')
+        # Set mode to edit or else bmesh.from_edit_mesh() will fail.
+        bpy.ops.object.mode_set(mode='EDIT')
+
+        # Apply each object's planned merges. Plan entries index into the
+        # object's face subset, so map them back to mesh polygon indices
+        # before resolving bmesh faces.
+        for obj, plan in zip(selected_objs, plans):
+            if not plan:
+                continue
+            face_indices = face_subsets[obj.name][0]
+            obj_bmesh = bmesh.from_edit_mesh(obj.data)
+            self._apply_merge_plan(
+                obj_bmesh, [face_indices[rect] for rect in plan])
+            bmesh.update_edit_mesh(obj.data)
+
+        _log.debug('Completed Face Scaling Operation.')
         return {'FINISHED'}
 
 
-    def _apply_face_scaling(
-        self, faces: [bmesh.types.BMFace], scale_factor: int, scale_window_shape: str) -> bool:
-        """Applies face scaling optimisation on quad topology bmesh face sequence.
+    def _gather_face_attrs(self, obj) -> tuple:
+        """Bulk-reads per-face attributes for object into numpy arrays.
+
+        Each foreach_get fills a contiguous preallocated numpy buffer in a
+        single C call, replacing the per-face `face.normal` and
+        `calc_center_bounds()` RNA round-trips downstream.
 
         Arguments:
-            faces: List of bmesh faces we want to apply scale optimisation to.
-            scale_factor: Defines `SCALExSCALE` face pattern we will be optimising.
-        
+            obj: Mesh object (in object mode) to read face attributes from.
+
         Returns:
-            `True` if applying face scaling succeeded, else `False`.
+            Tuple of `(normals (N,3), centers (N,3), sel_mask (N,),
+            loop_totals (N,), materials (N,))` arrays.
         """
-        planar_groups = self._group_faces_by_plane(faces)
-        print('Number of Planar Groups: %s' % len(planar_groups))
-        print('PLANAR GROUP: \n%s' % planar_groups)
-        
-        # Derive sliding window shape.
-        window_shape = self._derive_window_shape(scale_factor, scale_window_shape)
-        if window_shape is None:
-            return False
-        print('WINDOW SHAPE: (x:%s, y:%s)' %(window_shape.x, window_shape.y))
-
-        #       - First make sure planar group shape is greater than or equal to 2x2.
-        #       a) For each match merge faces into one.
-        #           - Ensure UV's are kept intact (research more on how to do this).
-        #               - Could be done by not remove edges between diff coloured quads.
-        #               - Look into Cycles "Bake" texture on new optimised mesh.
-        
-        # 7) Finalise mesh, cleanup and done.
-        #       - Maybe add timer of how long task took to complete.
-        return True
+        polygons = obj.data.polygons
+        face_cnt = len(polygons)
+        normals = np.empty(face_cnt * 3, dtype=np.float32)
+        centers = np.empty(face_cnt * 3, dtype=np.float32)
+        sel_mask = np.empty(face_cnt, dtype=np.bool_)
+        loop_totals = np.empty(face_cnt, dtype=np.int32)
+        # RNA int properties are 32-bit; an int64 buffer silently drops
+        # foreach_get to its per-item slow path. Gather as int32 and widen
+        # after, since the material lattice downstream is int64.
+        materials = np.empty(face_cnt, dtype=np.int32)
+        polygons.foreach_get('normal', normals)
+        polygons.foreach_get('center', centers)
+        polygons.foreach_get('select', sel_mask)
+        polygons.foreach_get('loop_total', loop_totals)
+        polygons.foreach_get('material_index', materials)
+        return (normals.reshape(face_cnt, 3), centers.reshape(face_cnt, 3),
+                sel_mask, loop_totals, materials.astype(np.int64))
+
+
+    def _compute_merge_plan(
+        self, normals: np.ndarray, centers: np.ndarray, materials: np.ndarray,
+        min_h: int, min_w: int) -> list:
+        """Plans which faces to merge, purely from the bulk-read arrays.
+
+        Deliberately touches no Blender API (no bmesh, no RNA) so it is safe
+        to run off the main thread; `_apply_merge_plan` performs the actual
+        mutation. Merges are planned with a greedy meshing sweep over each
+        planar group: runs extend along one axis then the other while the
+        material matches, emitting maximal rectangles. This merges large
+        uniform regions into single quads instead of tiling them with
+        fixed-size blocks, so far fewer faces and bmesh ops result. Rects
+        smaller than the requested window are not worth merging and get
+        dropped.
+
+        Arguments:
+            normals: `(N, 3)` float32 array of face normals (bulk-read).
+            centers: `(N, 3)` float32 array of face centers (bulk-read).
+            materials: `(N,)` int64 array of face material indices (bulk-read).
+            min_h: Minimum merge-region height (lattice rows).
+            min_w: Minimum merge-region width (lattice columns).
 
+        Returns:
+            List of per-rect int index arrays (into the given arrays), one
+            per planned merge region; empty when nothing is worth merging.
+            Rect boundaries are preserved deliberately: each rect must be
+            dissolved by its own op call (see `_apply_merge_plan`).
+        """
+        planar_groups = self._group_faces_by_plane(normals, centers, materials)
+        _log.debug('Number of Planar Groups: %s', len(planar_groups))
+        # Summarize rather than dump the groups: repr-ing every lattice in
+        # the dict stringifies megabytes on large meshes, even at DEBUG. The
+        # isEnabledFor guard skips building the summary dict entirely when
+        # debug logging is off.
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug('PLANAR GROUP SHAPES: %s',
+                       {key: grids[0].shape for key, grids in planar_groups.items()})
+
+        plan_parts = []
+        for key, (index_grid, material_grid) in planar_groups.items():
+            occupancy = (index_grid != -1).astype(np.uint8)
+            rects = _greedy_merge_rects(occupancy, material_grid)
+            rects = rects[(rects[:, 2] >= min_h) & (rects[:, 3] >= min_w)]
+            _log.debug('Planar group %s: %s merge rects planned.', key, len(rects))
+            for row, col, rect_h, rect_w in rects:
+                plan_parts.append(
+                    index_grid[row:row + rect_h, col:col + rect_w].ravel())
+
+        return plan_parts
+
+
+    def _apply_merge_plan(self, obj_bmesh, rect_face_indices: list) -> None:
+        """Dissolves the planned faces on the edit-mode bmesh.
+
+        The bmesh-mutating counterpart to `_compute_merge_plan`; must run on
+        the main thread. The dissolve is issued once per planned rect:
+        `bmesh.ops.dissolve_faces` joins every edge-connected region of its
+        input into a single face, so any wider batch fuses across the
+        boundaries the planner enforced — adjacent same-material rects
+        become concave n-gons that dodge the min-window filter,
+        perpendicular planes touching at voxel corners fuse into non-planar
+        n-gons, and a planned closed shell makes BM_faces_join raise. Each
+        rect, by construction, is exactly one planar same-material region.
 
-    def _group_faces_by_plane(self, faces: [bmesh.types.BMFace]) -> Dict[str, np.ndarray]:
+        Arguments:
+            obj_bmesh: Edit-mode bmesh to mutate in place.
+            rect_face_indices: List of per-rect arrays of mesh polygon
+                indices to dissolve, one array per merge region.
+        """
+        import bmesh
+
+        obj_bmesh.faces.ensure_lookup_table()
+        # Resolve every planned BMFace up front, before any dissolve
+        # invalidates the index-based lookup table; itemgetter performs the
+        # bulk lookup in C (it returns a bare element for a single index,
+        # hence the guard).
+        all_indices = np.concatenate(rect_face_indices)
+        planned_faces = np.empty(len(all_indices), dtype=object)
+        if len(all_indices) > 1:
+            planned_faces[:] = itemgetter(*all_indices)(obj_bmesh.faces)
+        else:
+            planned_faces[:] = [obj_bmesh.faces[i] for i in all_indices]
+
+        start = 0
+        for rect_indices in rect_face_indices:
+            stop = start + len(rect_indices)
+            bmesh.ops.dissolve_faces(
+                obj_bmesh, faces=list(planned_faces[start:stop]), use_verts=True)
+            start = stop
+
+
+    def _group_faces_by_plane(
+        self, normals: np.ndarray, centers: np.ndarray,
+        materials: np.ndarray) -> Dict[int, tuple]:
         """Segments faces from mesh into 2-dimension planar groups.
 
         This method will take in a list of faces making up a mesh and segment
@@ -284,135 +686,119 @@ class FaceScalingOperator(bpy.types.Operator):
         relative to eachother in planar groups.
 
         Arguments:
-            faces: List of faces to group by plane.
+            normals: `(N, 3)` float32 array of face normals (bulk-read).
+            centers: `(N, 3)` float32 array of face centers (bulk-read).
+            materials: `(N,)` int64 array of face material indices (bulk-read).
 
         Returns:
-            Dictionary, containing all mesh planar groups.
+            Dictionary, keyed by packed integer plane key (see key layout
+            comment below), of `(index_grid, material_grid)` lattice pairs.
+            `index_grid` holds int32 face indices (-1 for empty cells) so
+            the lattices stay plain C arrays; BMFace wrappers are only
+            resolved at merge time.
         """
         planar_groups = {}
-
-        for face in faces:
-            group_key = self._form_planar_group_key(face)
-
-            # If planar group for face doesn't exists then init one with face.
-            if not group_key in planar_groups:
-                planar_groups[group_key] = [face]
-                continue
-
-            # Add all faces to respective plane group.
-            planar_groups[group_key].append(face)
-
-        for key, faces in planar_groups.items():
-            # Get min and max x-axis and y-axis value to use for deriving shape of planar group.
-            min_x_axis = min([self._convert_face_pos_vec_to_2d(face).x for face in faces])
-            min_y_axis = min([self._convert_face_pos_vec_to_2d(face).y for face in faces])
-            max_x_axis = max([self._convert_face_pos_vec_to_2d(face).x for face in faces])
-            max_y_axis = max([self._convert_face_pos_vec_to_2d(face).y for face in faces])
-
-            # Define new planar group matrix with shape that enncompasses entire plane area.
-            planar_group_shape = (int((max_x_axis - min_x_axis) + 1), int((max_y_axis - min_y_axis) + 1))
-            planar_group_ndarray = np.zeros((planar_group_shape[1], planar_group_shape[0]), dtype='object')
-           
-            # Add faces into new planar group matrix in a way which encodes they're world position.
-            for face in faces:
-                face_center_vec = self._convert_face_pos_vec_to_2d(face)
-                col_index = int(face_center_vec.x - min_x_axis)
-                row_index = int(face_center_vec.y - min_y_axis)
-                planar_group_ndarray[row_index][col_index] = face
-            planar_groups[key] = planar_group_ndarray
+        face_cnt = len(normals)
+        if face_cnt == 0:
+            return planar_groups
+
+        # Quantize centers to 0.1 steps as integers for the lattice scatter.
+        quantized = np.rint(centers * 10).astype(np.int64)
+
+        # Plane key from the quantized spherical normal angles plus the
+        # plane offset d = -n.c (a locality-sensitive hash of the plane
+        # equation). Unlike snapping normal signs to {-1, 0, 1} this also
+        # groups faces whose normals drift slightly off-axis (e.g. slanted
+        # or imprecise voxel exports). Bins: ~5 degrees for the angles, 0.1
+        # for the offset, packed into one integer:
+        #
+        #   bits 50-56: theta bin (atan2(ny, nx), offset to non-negative)
+        #   bits 44-49: phi bin (arccos(nz))
+        #   bits  0-43: plane offset bin
+        #
+        # Integer keys hash in one op and the whole key array is built with
+        # a handful of vectorized C passes rather than per-face formatting.
+        # Canonicalize normals before binning: `+ 0.0` turns -0.0 into +0.0
+        # (atan2 is signed-zero sensitive: atan2(+-0, -0) = +-pi while
+        # atan2(+-0, +0) = +-0, which fragmented single +Z planes into
+        # several groups), and near-axis normals snap to the exact axis so
+        # voxel faces can never straddle a bin seam — notably the +-pi
+        # wraparound that splits -X planes whose tiny ny straddles zero.
+        unit_normals = normals.astype(np.float64) + 0.0
+        # rint of a tiny negative component yields -0.0, so the snap needs
+        # the same signed-zero scrub.
+        snapped = np.rint(unit_normals) + 0.0
+        near_axis = np.abs(unit_normals - snapped).max(axis=1) < 0.05
+        unit_normals[near_axis] = snapped[near_axis]
+
+        theta_bin = np.rint(
+            np.arctan2(unit_normals[:, 1], unit_normals[:, 0]) / 0.087).astype(np.int64)
+        phi_bin = np.rint(
+            np.arccos(np.clip(unit_normals[:, 2], -1.0, 1.0)) / 0.087).astype(np.int64)
+        offset = -np.einsum('ij,ij->i', unit_normals, centers.astype(np.float64))
+        offset_bin = np.rint(offset / 0.1).astype(np.int64)
+        keys = ((theta_bin + 64) << 50 | (phi_bin & 0x3F) << 44
+                | (offset_bin & 0xFFFFFFFFFFF))
+
+        # The lattice is still spanned by the two mesh axes perpendicular to
+        # the dominant normal axis (exact for voxel faces).
+        face_range = np.arange(face_cnt)
+        normal_axis = np.argmax(np.abs(normals), axis=1)
+
+        # In-plane 2D coordinate of each face (normal axis dropped).
+        plane_axes = _PLANE_AXES[normal_axis]
+        coords_2d = np.stack(
+            (quantized[face_range, plane_axes[:, 0]],
+             quantized[face_range, plane_axes[:, 1]]), axis=1)
+
+        # Bucketize faces by key in C: unique + stable argsort yields each
+        # planar group as one contiguous index slice, with no Python dict
+        # lookup or append per face.
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique_keys) + 1))
+
+        for i, key in enumerate(unique_keys):
+            group_indices = order[bounds[i]:bounds[i + 1]]
+            group_coords = coords_2d[group_indices]
+
+            # Define new planar group matrix with shape that encompasses the
+            # entire plane area. Voxel faces sit 1.0 apart, i.e. 10 quantized
+            # steps, hence the // 10 back to lattice cells.
+            mins = group_coords.min(axis=0)
+            cols = (group_coords[:, 0] - mins[0]) // 10
+            rows = (group_coords[:, 1] - mins[1]) // 10
+            grid_shape = (int(rows.max()) + 1, int(cols.max()) + 1)
+            index_grid = np.full(grid_shape, -1, dtype=np.int32)
+            material_grid = np.full(grid_shape, -1, dtype=np.int64)
+
+            # Add face indices into new planar group matrix in a way which
+            # encodes their world position; advanced indexing scatters in one
+            # C call. Storing int32 indices (not BMFace wrappers in an
+            # object-dtype array) keeps the lattice a plain C buffer with no
+            # per-cell refcount traffic, at a quarter of the memory. The
+            # material lattice mirrors the index lattice so merge planning
+            # can compare attributes without touching BMFace wrappers.
+            index_grid[rows, cols] = group_indices
+            material_grid[rows, cols] = materials[group_indices]
+            planar_groups[int(key)] = (index_grid, material_grid)
 
         return planar_groups
 
 
-    def _convert_face_pos_vec_to_2d(self, face: bmesh.types.BMFace) -> Tuple2DCoord:
-        """Convert 3D blender vector into a 2D tuple vector excluding the normal axis for given face.
-
-        We flatten the 3D Blender vector into a 2D tuple vector as planar groups are not 3D tensors.
-        This is done by excluding the normal axis of the face (axis which pokes through plane) and 
-        keep the two axis's which go vertically and horizontally along the plane.
-        
-        Arguments:
-            face: BMesh face to get normal axis and center position vector that is to be converted.
+    def _has_full_quad_topology(self, loop_totals: np.ndarray) -> bool:
+        """Check that all faces have 4 vertices, ensuring full-quad topology.
 
-        Returns:
-            Tuple2DCoord, with x and y axis of face on plane.
+        Operates on the `loop_total` array bulk-read alongside the other
+        face attributes in `execute`, so the check shares the single
+        foreach_get gather pass over the mesh instead of re-traversing
+        BMFace wrappers in Python.
         """
-        face_center_vec = face.calc_center_bounds()
-        if face.normal.x in [-1, 1]:
-            return Tuple2DCoord(round(face_center_vec.y, 1), round(face_center_vec.z, 1))
-        if face.normal.y in [-1, 1]:
-            return Tuple2DCoord(round(face_center_vec.x, 1), round(face_center_vec.z, 1))
-        return Tuple2DCoord(round(face_center_vec.x, 1), round(face_center_vec.y, 1))
-
-    
-    def _form_planar_group_key(self, face: bmesh.types.BMFace) -> str:
-        """Creates a dict key for planar group the given face belongs to.
-        
-        This method creates a key for the planar group dictionary, this key
-        is derived from the given mesh center and normal vector.
-
-        Keys are derived like so:
-
-        FN = Face Normal
-        FC = Face Center
-        KEY = '{FN.x}.{FN.y}.{FN.z}_'
-        if FN.x != 0: KEY += 'X{FC.x}'
-        if FN.y != 0: KEY += 'Y{FC.y}'
-        if FN.z != 0: KEY += 'Z{FC.z}'
+        return not np.any(loop_totals != 4)
 
-        Note: For the sake of readability I have not included decimal obj
-        conversion for floating-point precision correction.
 
-        Which should look something like this:
-
-        WHEN: 
-            FN = [0, -1, 0], FC = [8.5, 12, 3]
-        THEN:
-            KEY = "0.-1.0_Y12"
-
-        Arguments:
-            face: Face to derive planar group dict key from.
-
-        Returns:
-            String, planar group dictionary key derived from face.
-        """
-        fn = face.normal
-        fc = face.calc_center_bounds()
-        key = '%s.%s.%s_' % (int(fn.x), int(fn.y), int(fn.z))
-        if fn.x in [-1, 1]: key += 'X%s' % round(fc.x, 1)
-        if fn.y in [-1, 1]: key += 'Y%s' % round(fc.y, 1)
-        if fn.z in [-1, 1]: key += 'Z%s' % round(fc.z, 1)
-        return key
-
-
-    def _derive_window_shape(self, scale_factor: int, scale_window_shape: str) -> Tuple2DCoord:
-        """Derive sliding window shape based on given scale factor and desired shape.
-        
-        Arguments:
-            scale_factor: Integer used to scale window shape by.
-            scale_window_shape: Shape of the window e..g square, vertical rectangle etc.
-
-        Returns:
-            Tuple2DCoord containing window shape, else `None` if derivation fails.
-        """
-        if scale_window_shape == 'scale_window_shapes.square':
-            return Tuple2DCoord(scale_factor, scale_factor)
-        if scale_window_shape == 'scale_window_shapes.h_rect':
-            return Tuple2DCoord(0, scale_factor)
-        if scale_window_shape == 'scale_window_shapes.v_rect':
-            return Tuple2DCoord(scale_factor, 0)
-        self.report(
-            {'ERROR'}, 
-            'Unsupported window shape %s cannot be used (report this to dev).' % scale_window_shape)
-        return None
-
-
-    def _has_full_quad_topology(self, faces: [bmesh.types.BMFace]) -> bool:
-        """Check that all mesh faces have 4 vertices, ensuring full-quad topology."""
-        for face in faces:
-            if len(face.verts) != 4:
-                return False
-        return True
+# Hoisted for the same reason as _FACE_FILTER_OP_ID above.
+_FACE_SCALING_OP_ID = FaceScalingOperator.bl_idname
 
 
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
@@ -442,12 +828,12 @@ class MeshOptimisationPanel(VoxilatorPanel, bpy.types.Panel):
     bl_label  = 'Mesh Optimisation'
 
     def draw(self, context):
-        layout, scene = self.layout, context.scene
+        layout = self.layout
         
         box = layout.box()
         box.label(text='Filter Strategy')
         box.prop(context.scene.addon_props, 'filter_strats', text='')
-        box.operator(FaceFilterOperator.bl_idname, text='Filter')
+        box.operator(_FACE_FILTER_OP_ID, text='Filter')
 
         box = layout.box()
         box.label(text='Face Scaling')
@@ -455,7 +841,7 @@ class MeshOptimisationPanel(VoxilatorPanel, bpy.types.Panel):
         box.prop(context.scene.addon_props, 'scale_window_shape', text='Window Shape')
         box.prop(context.scene.addon_props, 'scale_selected_faces')
         box.prop(context.scene.addon_props, 'preserve_uv')
-        box.operator(FaceScalingOperator.bl_idname, text='Scale')
+        box.operator(_FACE_SCALING_OP_ID, text='Scale')
 
 
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
@@ -468,13 +854,16 @@ class MeshOptimisationPanel(VoxilatorPanel, bpy.types.Panel):
 class MeshOptimisationModule:
     """Mesh optimisation module wrapper."""
 
-    # List of classes to register (order matters)
-    CLASSES = [
+    # Tuple of classes to register (order matters); a tuple is stored as a
+    # constant in the module code object, and the reversed order is
+    # precomputed so unregister never re-reverses per call.
+    CLASSES = (
         FaceFilterOperator,
         FaceScalingOperator,
         AddonProperties,
         MeshOptimisationPanel
-    ]
+    )
+    _CLASSES_REVERSED = CLASSES[::-1]
 
     @staticmethod
     def register():
@@ -482,12 +871,12 @@ class MeshOptimisationModule:
         for cls in MeshOptimisationModule.CLASSES:
             register_class(cls)
         AddonProperties.register_addon_props()
-        print('Mesh Optimisation Module Class Register Procedure Completed.')
+        _log.debug('Mesh Optimisation Module Class Register Procedure Completed.')
 
     @staticmethod
     def unregister():
         from bpy.utils import unregister_class
-        for cls in reversed(MeshOptimisationModule.CLASSES):
+        for cls in MeshOptimisationModule._CLASSES_REVERSED:
             unregister_class(cls)
         AddonProperties.unregister_addon_props()
-        print('Mesh Optimisation Module Class Unregisteration Procedure Completed,')
\ No newline at end of file
+        _log.debug('Mesh Optimisation Module Class Unregisteration Procedure Completed.')
\ No newline at end of file